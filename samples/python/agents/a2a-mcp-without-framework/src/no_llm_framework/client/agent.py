@@ -26,6 +26,10 @@ from no_llm_framework.client.constant import GOOGLE_API_KEY
 
 dir_path = Path(__file__).parent
 
+# Compiled once at import; these run on every LLM round / agent reply.
+JSON_BLOCK_PATTERN = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+ANSWER_PATTERN = re.compile(r'<Answer>(.*?)</Answer>', re.DOTALL)
+
 with Path(dir_path / 'decide.jinja').open('r') as f:
     decide_template = Template(f.read())
 
@@ -142,8 +146,7 @@ class Agent:
         Args:
             response (str): The response from the LLM.
         """
-        pattern = r'```json\n(.*?)\n```'
-        match = re.search(pattern, response, re.DOTALL)
+        match = JSON_BLOCK_PATTERN.search(response)
         if match:
             return json.loads(match.group(1))
         return []
@@ -205,9 +208,7 @@ class Agent:
                             self.token_stream_callback(chunk)
                         yield chunk
                     yield '</Agent>\n'
-                    match = re.search(
-                        r'<Answer>(.*?)</Answer>', agent_response, re.DOTALL
-                    )
+                    match = ANSWER_PATTERN.search(agent_response)
                     answer = match.group(1).strip() if match else agent_response
                     agent_answers.append(
                         {
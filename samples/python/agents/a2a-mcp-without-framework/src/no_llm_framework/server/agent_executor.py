@@ -1,3 +1,4 @@
+import time
 import uuid
 
 from typing import override
@@ -17,6 +18,15 @@ from a2a.utils import new_agent_text_message, new_task
 from no_llm_framework.server.agent import Agent
 
 
+# Coalesce streamed tokens into fewer artifact events: buffer until the
+# pending text reaches this size or this much time has passed since the
+# last flush. Each enqueue crosses the async scheduler and the server's
+# serialization path, so one event per token dominates the cost of
+# streaming small chunks.
+FLUSH_MAX_CHARS = 256
+FLUSH_INTERVAL_SECONDS = 0.05
+
+
 class HelloWorldAgentExecutor(AgentExecutor):
     """Test AgentProxy Implementation."""
 
@@ -45,9 +55,38 @@ class HelloWorldAgentExecutor(AgentExecutor):
 
         artifact_id = str(uuid.uuid4())
         first_chunk = True
+        started = False
+        pending: list[str] = []
+        pending_chars = 0
+        last_flush = time.monotonic()
+
+        async def flush() -> None:
+            """Emit the buffered text as one artifact update event."""
+            nonlocal first_chunk, pending_chars, last_flush
+            if not pending:
+                return
+            await event_queue.enqueue_event(
+                TaskArtifactUpdateEvent(
+                    append=not first_chunk,
+                    context_id=task.context_id,
+                    task_id=task.id,
+                    last_chunk=False,
+                    artifact=Artifact(
+                        artifact_id=artifact_id,
+                        name='current_result',
+                        description='Result of request to agent.',
+                        parts=[Part(text=''.join(pending))],
+                    ),
+                )
+            )
+            pending.clear()
+            pending_chars = 0
+            first_chunk = False
+            last_flush = time.monotonic()
 
         async for event in self.agent.stream(query):
             if event['is_task_complete']:
+                await flush()
                 await event_queue.enqueue_event(
                     TaskArtifactUpdateEvent(
                         append=not first_chunk,
@@ -70,6 +109,7 @@ class HelloWorldAgentExecutor(AgentExecutor):
                     )
                 )
             elif event['require_user_input']:
+                await flush()
                 await event_queue.enqueue_event(
                     TaskStatusUpdateEvent(
                         status=TaskStatus(
@@ -86,7 +126,7 @@ class HelloWorldAgentExecutor(AgentExecutor):
                 )
                 first_chunk = False
             else:
-                if first_chunk:
+                if not started:
                     await event_queue.enqueue_event(
                         TaskStatusUpdateEvent(
                             status=TaskStatus(
@@ -96,21 +136,15 @@ class HelloWorldAgentExecutor(AgentExecutor):
                             task_id=task.id,
                         )
                     )
-                await event_queue.enqueue_event(
-                    TaskArtifactUpdateEvent(
-                        append=not first_chunk,
-                        context_id=task.context_id,
-                        task_id=task.id,
-                        last_chunk=False,
-                        artifact=Artifact(
-                            artifact_id=artifact_id,
-                            name='current_result',
-                            description='Result of request to agent.',
-                            parts=[Part(text=event['content'])],
-                        ),
-                    )
-                )
-                first_chunk = False
+                    started = True
+                pending.append(event['content'])
+                pending_chars += len(event['content'])
+                if (
+                    pending_chars >= FLUSH_MAX_CHARS
+                    or time.monotonic() - last_flush >= FLUSH_INTERVAL_SECONDS
+                ):
+                    await flush()
+        await flush()
 
     @override
     async def cancel(
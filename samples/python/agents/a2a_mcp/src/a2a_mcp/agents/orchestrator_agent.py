@@ -34,10 +34,14 @@ class OrchestratorAgent(BaseAgent):
         self.travel_context = {}
         self.query_history = []
         self.context_id = None
+        # One client for all LLM calls; rebuilding it per call redid auth
+        # and transport setup. Keeping the static chain-of-thought
+        # instructions at the start of every prompt also lets the serving
+        # side reuse its prompt-prefix cache across calls.
+        self.client = genai.Client()
 
     async def generate_summary(self) -> str:
-        client = genai.Client()
-        response = client.models.generate_content(
+        response = self.client.models.generate_content(
             model='gemini-2.0-flash',
             contents=prompts.SUMMARY_COT_INSTRUCTIONS.replace(
                 '{travel_data}', str(self.results)
@@ -48,8 +52,7 @@ class OrchestratorAgent(BaseAgent):
 
     def answer_user_question(self, question) -> str:
         try:
-            client = genai.Client()
-            response = client.models.generate_content(
+            response = self.client.models.generate_content(
                 model='gemini-2.0-flash',
                 contents=prompts.QA_COT_PROMPT.replace(
                     '{TRIP_CONTEXT}', str(self.travel_context)
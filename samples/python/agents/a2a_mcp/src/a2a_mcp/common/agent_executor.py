@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
@@ -27,6 +28,9 @@ class GenericAgentExecutor(AgentExecutor):
 
     def __init__(self, agent: BaseAgent):
         self.agent = agent
+        # Running executions by task id, so cancel() can interrupt the
+        # in-flight agent call instead of rejecting the request.
+        self._running_tasks: dict[str, asyncio.Task] = {}
 
     async def execute(
         self,
@@ -48,6 +52,19 @@ class GenericAgentExecutor(AgentExecutor):
 
         updater = TaskUpdater(event_queue, task.id, task.context_id)
 
+        self._running_tasks[task.id] = asyncio.current_task()
+        try:
+            await self._stream_agent_response(task, updater, event_queue, query)
+        finally:
+            self._running_tasks.pop(task.id, None)
+
+    async def _stream_agent_response(
+        self,
+        task: Task,
+        updater: TaskUpdater,
+        event_queue: EventQueue,
+        query: str,
+    ) -> None:
         async for item in self.agent.stream(query, task.context_id, task.id):
             # Agent to Agent call will return events,
             # Update the relevant ids to proxy back.
@@ -103,4 +120,13 @@ class GenericAgentExecutor(AgentExecutor):
     async def cancel(
         self, request: RequestContext, event_queue: EventQueue
     ) -> Task | None:
-        raise ServerError(error=UnsupportedOperationError())
+        task = request.current_task
+        running = self._running_tasks.get(task.id) if task else None
+        if not running:
+            # Nothing in flight for this task, nothing to interrupt.
+            raise ServerError(error=UnsupportedOperationError())
+        logger.info(f'Cancelling in-flight execution for task {task.id}')
+        running.cancel()
+        updater = TaskUpdater(event_queue, task.id, task.context_id)
+        await updater.update_status(TaskState.canceled, final=True)
+        return task
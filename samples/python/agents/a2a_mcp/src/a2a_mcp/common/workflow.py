@@ -1,5 +1,6 @@
-import json
+import asyncio
 import logging
+import time
 import uuid
 
 from collections.abc import AsyncIterable
@@ -8,6 +9,7 @@ from uuid import uuid4
 
 import httpx
 import networkx as nx
+import orjson
 
 from a2a.client import A2AClient
 from a2a.types import (
@@ -25,6 +27,65 @@ from a2a_mcp.mcp import client
 
 logger = logging.getLogger(__name__)
 
+# Agent card lookups go through the MCP server on every node run, but the
+# cards themselves change rarely. Cache them for a short window so repeated
+# workflow runs skip the MCP round trip.
+CARD_CACHE_TTL_SECONDS = 300.0
+
+# Upper bound on concurrently executing workflow nodes. A large fan-out
+# would otherwise open one streaming call per node at once and can
+# overwhelm downstream agents or local socket limits.
+MAX_PARALLEL_NODES = 5
+
+# Transient transport failures (connection refused/reset while an agent
+# restarts) are retried with exponential backoff before the node is given
+# up on.
+MAX_NODE_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.5
+
+# Cap on chunks buffered between node streams and the workflow consumer.
+# When the consumer falls behind, producers block on the queue instead of
+# growing it without bound.
+MERGE_QUEUE_MAXSIZE = 64
+_card_cache: dict[str, tuple[float, AgentCard]] = {}
+
+
+def _get_cached_card(key: str) -> AgentCard | None:
+    entry = _card_cache.get(key)
+    if entry and time.monotonic() - entry[0] < CARD_CACHE_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def _store_cached_card(key: str, card: AgentCard) -> None:
+    _card_cache[key] = (time.monotonic(), card)
+
+
+# In-flight lookups keyed like the cache. Parallel nodes that need the same
+# card share one MCP request instead of issuing duplicates.
+_card_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _resolve_card(key: str, fetch) -> AgentCard:
+    """Resolve a card, coalescing concurrent identical lookups.
+
+    The first caller starts the fetch; every other caller with the same
+    key awaits the same in-flight task. The result lands in the TTL cache
+    for later runs.
+    """
+    card = _get_cached_card(key)
+    if card:
+        return card
+    task = _card_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _card_inflight[key] = task
+        task.add_done_callback(lambda _t: _card_inflight.pop(key, None))
+    # Shield so one cancelled waiter does not kill the shared lookup.
+    card = await asyncio.shield(task)
+    _store_cached_card(key, card)
+    return card
+
 
 class Status(Enum):
     """Represents the status of a workflow and its associated node."""
@@ -45,6 +106,10 @@ class WorkflowNode:
 
     """
 
+    # Workflows can fan out into many nodes; fixed slots keep each one
+    # small and make attribute access a direct offset lookup.
+    __slots__ = ('id', 'node_key', 'node_label', 'task', 'results', 'state')
+
     def __init__(
         self,
         task: str,
@@ -60,6 +125,12 @@ class WorkflowNode:
 
     async def get_planner_resource(self) -> AgentCard | None:
         logger.info(f'Getting resource for node {self.id}')
+        return await _resolve_card(
+            'resource://agent_cards/planner_agent',
+            self._fetch_planner_resource,
+        )
+
+    async def _fetch_planner_resource(self) -> AgentCard:
         config = get_mcp_server_config()
         async with client.init_session(
             config.host, config.port, config.transport
@@ -67,17 +138,22 @@ class WorkflowNode:
             response = await client.find_resource(
                 session, 'resource://agent_cards/planner_agent'
             )
-            data = json.loads(response.contents[0].text)
+            data = orjson.loads(response.contents[0].text)
             return AgentCard(**data['agent_card'][0])
 
     async def find_agent_for_task(self) -> AgentCard | None:
         logger.info(f'Find agent for task - {self.task}')
+        return await _resolve_card(
+            f'task::{self.task}', self._fetch_agent_for_task
+        )
+
+    async def _fetch_agent_for_task(self) -> AgentCard:
         config = get_mcp_server_config()
         async with client.init_session(
             config.host, config.port, config.transport
         ) as session:
             result = await client.find_agent(session, self.task)
-            agent_card_json = json.loads(result.content[0].text)
+            agent_card_json = orjson.loads(result.content[0].text)
             logger.debug(f'Found agent {agent_card_json} for task {self.task}')
             return AgentCard(**agent_card_json)
 
@@ -93,30 +169,50 @@ class WorkflowNode:
             agent_card = await self.get_planner_resource()
         else:
             agent_card = await self.find_agent_for_task()
-        async with httpx.AsyncClient() as httpx_client:
-            client = A2AClient(httpx_client, agent_card)
-
-            payload: dict[str, any] = {
-                'message': {
-                    'role': 'user',
-                    'parts': [{'kind': 'text', 'text': query}],
-                    'messageId': uuid4().hex,
-                    'taskId': task_id,
-                    'contextId': context_id,
-                },
-            }
-            request = SendStreamingMessageRequest(
-                id=str(uuid4()), params=MessageSendParams(**payload)
-            )
-            response_stream = client.send_message_streaming(request)
-            async for chunk in response_stream:
-                # Save the artifact as a result of the node
-                if isinstance(
-                    chunk.root, SendStreamingMessageSuccessResponse
-                ) and (isinstance(chunk.root.result, TaskArtifactUpdateEvent)):
-                    artifact = chunk.root.result.artifact
-                    self.results = artifact
-                yield chunk
+        for attempt in range(MAX_NODE_ATTEMPTS):
+            yielded = False
+            try:
+                async with httpx.AsyncClient() as httpx_client:
+                    client = A2AClient(httpx_client, agent_card)
+
+                    payload: dict[str, any] = {
+                        'message': {
+                            'role': 'user',
+                            'parts': [{'kind': 'text', 'text': query}],
+                            'messageId': uuid4().hex,
+                            'taskId': task_id,
+                            'contextId': context_id,
+                        },
+                    }
+                    request = SendStreamingMessageRequest(
+                        id=str(uuid4()), params=MessageSendParams(**payload)
+                    )
+                    response_stream = client.send_message_streaming(request)
+                    async for chunk in response_stream:
+                        yielded = True
+                        # Save the artifact as a result of the node
+                        if isinstance(
+                            chunk.root, SendStreamingMessageSuccessResponse
+                        ) and (
+                            isinstance(
+                                chunk.root.result, TaskArtifactUpdateEvent
+                            )
+                        ):
+                            artifact = chunk.root.result.artifact
+                            self.results = artifact
+                        yield chunk
+                return
+            except httpx.TransportError as e:
+                # Retrying is only safe while nothing has been delivered
+                # downstream yet.
+                if yielded or attempt == MAX_NODE_ATTEMPTS - 1:
+                    raise
+                delay = RETRY_BACKOFF_SECONDS * (2**attempt)
+                logger.warning(
+                    f'Node {self.id} transport error ({e}), '
+                    f'retrying in {delay}s'
+                )
+                await asyncio.sleep(delay)
 
 
 class WorkflowGraph:
@@ -129,18 +225,28 @@ class WorkflowGraph:
         self.node_type = None
         self.state = Status.INITIALIZED
         self.paused_node_id = None
+        # Cached topological order; recomputed lazily after the graph
+        # changes instead of on every run_workflow call.
+        self._sorted_nodes: tuple[str, ...] | None = None
 
     def add_node(self, node) -> None:
         logger.info(f'Adding node {node.id}')
         self.graph.add_node(node.id, query=node.task)
         self.nodes[node.id] = node
         self.latest_node = node.id
+        self._sorted_nodes = None
 
     def add_edge(self, from_node_id: str, to_node_id: str) -> None:
         if from_node_id not in self.nodes or to_node_id not in self.nodes:
             raise ValueError('Invalid node IDs')
 
         self.graph.add_edge(from_node_id, to_node_id)
+        self._sorted_nodes = None
+
+    def _topological_order(self) -> tuple[str, ...]:
+        if self._sorted_nodes is None:
+            self._sorted_nodes = tuple(nx.topological_sort(self.graph))
+        return self._sorted_nodes
 
     async def run_workflow(
         self, start_node_id: str | None = None
@@ -157,43 +263,129 @@ class WorkflowGraph:
             applicable_graph.add(node_id)
             applicable_graph.update(nx.descendants(self.graph, node_id))
 
-        complete_graph = list(nx.topological_sort(self.graph))
+        complete_graph = self._topological_order()
         sub_graph = [n for n in complete_graph if n in applicable_graph]
         logger.info(f'Sub graph {sub_graph} size {len(sub_graph)}')
         self.state = Status.RUNNING
-        # Alternative is to loop over all nodes, but we only need the connected nodes.
-        for node_id in sub_graph:
-            node = self.nodes[node_id]
-            node.state = Status.RUNNING
-            query = self.graph.nodes[node_id].get('query')
-            task_id = self.graph.nodes[node_id].get('task_id')
-            context_id = self.graph.nodes[node_id].get('context_id')
-            async for chunk in node.run_node(query, task_id, context_id):
-                # When the workflow node is paused, do not yield any chunks
-                # but, let the loop complete.
+        # Wave scheduling over the DAG: topological generations of the
+        # applicable sub-graph run one after another, honoring every
+        # declared edge, while the data-independent nodes inside a
+        # generation run concurrently. A plain chain degenerates to the
+        # old sequential walk; a wide fan-out overlaps its agent calls.
+        for generation in nx.topological_generations(
+            self.graph.subgraph(sub_graph)
+        ):
+            # Keep the deterministic topological-sort order within a wave.
+            generation = set(generation)
+            wave = [n for n in sub_graph if n in generation]
+            if not wave:
+                continue
+            logger.info(f'Running wave of {len(wave)} node(s)')
+            async for chunk in self._run_nodes_parallel(wave):
+                yield chunk
+            if self.state == Status.PAUSED:
+                break
+        if self.state == Status.RUNNING:
+            self.state = Status.COMPLETED
+
+    async def _run_nodes_parallel(
+        self, node_ids: list[str]
+    ) -> AsyncIterable[dict[str, any]]:
+        """Run data-independent nodes concurrently and merge their streams.
+
+        Each node streams into a shared queue from its own task, so the
+        network waits of the individual agent calls overlap instead of
+        accumulating.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=MERGE_QUEUE_MAXSIZE)
+        done = object()
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_NODES)
+        errors: list[tuple[str, Exception]] = []
+
+        async def drain(node: WorkflowNode) -> None:
+            query = self.graph.nodes[node.id].get('query')
+            task_id = self.graph.nodes[node.id].get('task_id')
+            context_id = self.graph.nodes[node.id].get('context_id')
+            try:
+                async with semaphore:
+                    node.state = Status.RUNNING
+                    async for chunk in node.run_node(
+                        query, task_id, context_id
+                    ):
+                        # put_nowait skips a trip through the scheduler
+                        # while there is room; once the consumer falls
+                        # MERGE_QUEUE_MAXSIZE chunks behind, fall back to
+                        # a blocking put so producers apply backpressure.
+                        try:
+                            queue.put_nowait((node, chunk))
+                        except asyncio.QueueFull:
+                            logger.debug(
+                                f'Merge queue full ({queue.qsize()}); '
+                                f'node {node.id} waiting on consumer'
+                            )
+                            await queue.put((node, chunk))
+            except Exception as e:
+                # One failing node should not take down its siblings;
+                # record it and let the rest of the wave finish.
+                errors.append((node.id, e))
+                logger.exception(f'Node {node.id} failed')
+            finally:
+                # The consumer reads until every sentinel has arrived;
+                # shield the put so a cancellation landing right here
+                # cannot swallow the sentinel and strand the consumer.
+                await asyncio.shield(queue.put((node, done)))
+
+        # The TaskGroup guarantees every drain task is awaited on exit,
+        # including the early-cancel path below; drain collects node
+        # failures into `errors` rather than aborting the group.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(drain(self.nodes[node_id]))
+                for node_id in node_ids
+            ]
+
+            pending = len(tasks)
+            while pending:
+                node, chunk = await queue.get()
+                if chunk is done:
+                    pending -= 1
+                    if node.state == Status.RUNNING:
+                        node.state = Status.COMPLETED
+                    continue
+                # Mirrors the pause detection of the sequential path.
                 if node.state != Status.PAUSED:
                     if isinstance(
                         chunk.root, SendStreamingMessageSuccessResponse
-                    ) and (
-                        isinstance(chunk.root.result, TaskStatusUpdateEvent)
-                    ):
+                    ) and isinstance(chunk.root.result, TaskStatusUpdateEvent):
                         task_status_event = chunk.root.result
-                        context_id = task_status_event.context_id
                         if (
                             task_status_event.status.state
                             == TaskState.input_required
-                            and context_id
+                            and task_status_event.context_id
                         ):
                             node.state = Status.PAUSED
                             self.state = Status.PAUSED
                             self.paused_node_id = node.id
                     yield chunk
-            if self.state == Status.PAUSED:
-                break
-            if node.state == Status.RUNNING:
-                node.state = Status.COMPLETED
-        if self.state == Status.RUNNING:
-            self.state = Status.COMPLETED
+                if self.state == Status.PAUSED:
+                    # The workflow resumes from the paused node, so whatever
+                    # the rest of the wave produces would be thrown away.
+                    # Cancel the siblings instead of waiting them out, then
+                    # keep draining (discarding) until every sentinel has
+                    # arrived so no producer stays blocked on the bounded
+                    # queue.
+                    for task in tasks:
+                        task.cancel()
+                    while pending:
+                        node, chunk = await queue.get()
+                        if chunk is done:
+                            pending -= 1
+                    break
+        if errors:
+            logger.warning(
+                f'{len(errors)} node(s) failed in wave: '
+                f'{[node_id for node_id, _ in errors]}'
+            )
 
     def set_node_attribute(self, node_id, attribute, value) -> None:
         nx.set_node_attributes(self.graph, {node_id: value}, attribute)
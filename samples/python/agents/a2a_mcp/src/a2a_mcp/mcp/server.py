@@ -7,9 +7,10 @@ import traceback
 from pathlib import Path
 
 import google.generativeai as genai
+import httpx
 import numpy as np
+import orjson
 import pandas as pd
-import requests
 
 from a2a_mcp.common.utils import init_api_key
 from mcp.server.fastmcp import FastMCP
@@ -65,13 +66,13 @@ def load_agent_cards():
             if file_path.is_file():
                 logger.info(f'Reading file: {filename}')
                 try:
-                    with file_path.open('r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        card_uris.append(
-                            f'resource://agent_cards/{Path(filename).stem}'
-                        )
-                        agent_cards.append(data)
-                except json.JSONDecodeError as jde:
+                    # orjson parses straight from bytes, no text decode pass.
+                    data = orjson.loads(file_path.read_bytes())
+                    card_uris.append(
+                        f'resource://agent_cards/{Path(filename).stem}'
+                    )
+                    agent_cards.append(data)
+                except orjson.JSONDecodeError as jde:
                     logger.error(f'JSON Decoder Error {jde}')
                 except OSError as e:
                     logger.error(f'Error reading file {filename}: {e}.')
@@ -103,7 +104,9 @@ def build_agent_card_embeddings() -> pd.DataFrame:
                 {'card_uri': card_uris, 'agent_card': agent_cards}
             )
             df['card_embeddings'] = df.apply(
-                lambda row: generate_embeddings(json.dumps(row['agent_card'])),
+                lambda row: generate_embeddings(
+                    orjson.dumps(row['agent_card']).decode()
+                ),
                 axis=1,
             )
             return df
@@ -130,6 +133,21 @@ def serve(host, port, transport):  # noqa: PLR0915
 
     df = build_agent_card_embeddings()
 
+    # The card payloads are static after startup; precompute the resource
+    # responses once instead of scanning the dataframe on every read.
+    agent_card_uris = df['card_uri'].to_list() if df is not None else []
+    agent_cards_by_uri = (
+        dict(zip(df['card_uri'], df['agent_card'], strict=True))
+        if df is not None
+        else {}
+    )
+
+    # Identical queries (retries, repeated workflow runs) re-embed the same
+    # text and re-rank the same cards. The card set is fixed for the
+    # lifetime of the server, so the best match per query is cacheable.
+    find_agent_cache = {}
+    find_agent_cache_max = 128
+
     @mcp.tool(
         name='find_agent',
         description='Finds the most relevant agent card based on a natural language query string.',
@@ -151,6 +169,10 @@ def serve(host, port, transport):  # noqa: PLR0915
             The json representing the agent card deemed most relevant
             to the input query based on embedding similarity.
         """
+        cached = find_agent_cache.get(query)
+        if cached is not None:
+            logger.debug(f'find_agent cache hit for query: {query}')
+            return cached
         query_embedding = genai.embed_content(
             model=MODEL, content=query, task_type='retrieval_query'
         )
@@ -161,10 +183,15 @@ def serve(host, port, transport):  # noqa: PLR0915
         logger.debug(
             f'Found best match at index {best_match_index} with score {dot_products[best_match_index]}'
         )
-        return df.iloc[best_match_index]['agent_card']
+        best_match = df.iloc[best_match_index]['agent_card']
+        if len(find_agent_cache) >= find_agent_cache_max:
+            # Drop the oldest entry to keep the cache bounded.
+            find_agent_cache.pop(next(iter(find_agent_cache)))
+        find_agent_cache[query] = best_match
+        return best_match
 
     @mcp.tool()
-    def query_places_data(query: str):
+    async def query_places_data(query: str):
         """Query Google Places."""
         logger.info(f'Search for places : {query}')
         api_key = os.getenv('GOOGLE_PLACES_API_KEY')
@@ -184,19 +211,23 @@ def serve(host, port, transport):  # noqa: PLR0915
         }
 
         try:
-            response = requests.post(
-                PLACES_API_URL, headers=headers, json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as http_err:
+            # The blocking requests call stalled the server's event loop
+            # for the whole Places round trip; the async client lets other
+            # tool calls proceed while this one waits on the network.
+            async with httpx.AsyncClient() as http_client:
+                response = await http_client.post(
+                    PLACES_API_URL, headers=headers, json=payload
+                )
+                response.raise_for_status()
+                return response.json()
+        except httpx.HTTPStatusError as http_err:
             logger.info(f'HTTP error occurred: {http_err}')
             logger.info(f'Response content: {response.text}')
-        except requests.exceptions.ConnectionError as conn_err:
+        except httpx.ConnectError as conn_err:
             logger.info(f'Connection error occurred: {conn_err}')
-        except requests.exceptions.Timeout as timeout_err:
+        except httpx.TimeoutException as timeout_err:
             logger.info(f'Timeout error occurred: {timeout_err}')
-        except requests.exceptions.RequestException as req_err:
+        except httpx.HTTPError as req_err:
             logger.info(
                 f'An unexpected error occurred with the request: {req_err}'
             )
@@ -236,7 +267,7 @@ def serve(host, port, transport):  # noqa: PLR0915
                 cursor.execute(query)
                 rows = cursor.fetchall()
                 result = {'results': [dict(row) for row in rows]}
-                return json.dumps(result)
+                return orjson.dumps(result).decode()
         except Exception as e:
             logger.error(f'Exception running query {e}')
             logger.error(traceback.format_exc())
@@ -260,7 +291,7 @@ def serve(host, port, transport):  # noqa: PLR0915
         """
         resources = {}
         logger.info('Starting read resources')
-        resources['agent_cards'] = df['card_uri'].to_list()
+        resources['agent_cards'] = agent_card_uris
         return resources
 
     @mcp.resource(
@@ -279,12 +310,8 @@ def serve(host, port, transport):  # noqa: PLR0915
         logger.info(
             f'Starting read resource resource://agent_cards/{card_name}'
         )
-        resources['agent_card'] = (
-            df.loc[
-                df['card_uri'] == f'resource://agent_cards/{card_name}',
-                'agent_card',
-            ]
-        ).to_list()
+        card = agent_cards_by_uri.get(f'resource://agent_cards/{card_name}')
+        resources['agent_card'] = [card] if card is not None else []
 
         return resources
 
@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
@@ -19,6 +20,11 @@ from google.genai import types
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between identical 'Working...' heartbeats. The ADK can
+# emit many intermediate events in one burst; each heartbeat is a separate
+# enqueue and transport round trip, so coalesce them.
+HEARTBEAT_INTERVAL_SECONDS = 0.25
+
 
 class QnAAgentExecutor(AgentExecutor):
     """Agent executor that uses the ADK to answer questions."""
@@ -76,6 +82,7 @@ class QnAAgentExecutor(AgentExecutor):
             session_id=context.context_id,
         )
 
+        last_heartbeat = 0.0
         async for event in self.runner.run_async(
             session_id=session.id, user_id='123', new_message=content
         ):
@@ -91,9 +98,13 @@ class QnAAgentExecutor(AgentExecutor):
                 )
                 await updater.complete()
                 break
-            await updater.update_status(
-                TaskState.working, message=new_agent_text_message('Working...')
-            )
+            now = time.monotonic()
+            if now - last_heartbeat >= HEARTBEAT_INTERVAL_SECONDS:
+                await updater.update_status(
+                    TaskState.working,
+                    message=new_agent_text_message('Working...'),
+                )
+                last_heartbeat = now
         else:
             logger.debug('Agent failed to complete')
             await updater.update_status(
@@ -6,6 +6,14 @@ from google.adk.agents import LlmAgent
 from pydantic import BaseModel, Field
 
 
+# One shared client so the Frankfurter TCP/TLS connection is reused
+# across tool calls instead of being re-established per request.
+_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(30, connect=5),
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=100),
+)
+
+
 async def get_latest_rates(
     base: str = 'EUR', symbols: str | None = None
 ) -> dict:
@@ -15,17 +23,16 @@ async def get_latest_rates(
         base: The base currency symbol (default: EUR).
         symbols: A comma-separated list of target currency symbols to filter.
     """
-    async with httpx.AsyncClient() as client:
-        params = {}
-        if base:
-            params['base'] = base
-        if symbols:
-            params['symbols'] = symbols
-        response = await client.get(
-            'https://api.frankfurter.dev/v1/latest', params=params
-        )
-        response.raise_for_status()
-        return response.json()
+    params = {}
+    if base:
+        params['base'] = base
+    if symbols:
+        params['symbols'] = symbols
+    response = await _client.get(
+        'https://api.frankfurter.dev/v1/latest', params=params
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 async def get_historical_rates(
@@ -38,17 +45,16 @@ async def get_historical_rates(
         base: The base currency symbol.
         symbols: A comma-separated list of target currency symbols.
     """
-    async with httpx.AsyncClient() as client:
-        params = {}
-        if base:
-            params['base'] = base
-        if symbols:
-            params['symbols'] = symbols
-        response = await client.get(
-            f'https://api.frankfurter.dev/v1/{date}', params=params
-        )
-        response.raise_for_status()
-        return response.json()
+    params = {}
+    if base:
+        params['base'] = base
+    if symbols:
+        params['symbols'] = symbols
+    response = await _client.get(
+        f'https://api.frankfurter.dev/v1/{date}', params=params
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 async def get_time_series_rates(
@@ -69,23 +75,21 @@ async def get_time_series_rates(
     if end_date:
         url += end_date
 
-    async with httpx.AsyncClient() as client:
-        params = {}
-        if base:
-            params['base'] = base
-        if symbols:
-            params['symbols'] = symbols
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    params = {}
+    if base:
+        params['base'] = base
+    if symbols:
+        params['symbols'] = symbols
+    response = await _client.get(url, params=params)
+    response.raise_for_status()
+    return response.json()
 
 
 async def get_available_currencies() -> dict:
     """Retrieve a list of all available currency symbols and their full names."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get('https://api.frankfurter.dev/v1/currencies')
-        response.raise_for_status()
-        return response.json()
+    response = await _client.get('https://api.frankfurter.dev/v1/currencies')
+    response.raise_for_status()
+    return response.json()
 
 
 class AgentResponse(BaseModel):
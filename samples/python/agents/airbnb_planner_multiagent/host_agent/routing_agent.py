@@ -83,35 +83,53 @@ class RoutingAgent:
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
         self.agents: str = ''
+        self._instruction_prefix: str = ''
+        self._instruction_suffix: str = ''
+        # One pooled client shared by card resolution and every remote agent
+        # connection, so repeated calls reuse keep-alive sockets instead of
+        # opening a new connection per hop.
+        self._httpx_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30, connect=5),
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=100
+            ),
+        )
 
     async def _async_init_components(
         self, remote_agent_addresses: list[str]
     ) -> None:
         """Asynchronous part of initialization."""
-        # Use a single httpx.AsyncClient for all card resolutions for efficiency
-        async with httpx.AsyncClient(timeout=30) as client:
-            for address in remote_agent_addresses:
-                card_resolver = A2ACardResolver(
-                    client, address
-                )  # Constructor is sync
-                try:
-                    card = (
-                        await card_resolver.get_agent_card()
-                    )  # get_agent_card is async
-
-                    remote_connection = RemoteAgentConnections(
-                        agent_card=card, agent_url=address
-                    )
-                    self.remote_agent_connections[card.name] = remote_connection
-                    self.cards[card.name] = card
-                except httpx.ConnectError as e:
-                    print(
-                        f'ERROR: Failed to get agent card from {address}: {e}'
-                    )
-                except Exception as e:  # Catch other potential errors
-                    print(
-                        f'ERROR: Failed to initialize connection for {address}: {e}'
-                    )
+        # The shared pooled client resolves the cards and is reused by every
+        # remote agent connection afterwards.
+
+        async def resolve(address: str) -> None:
+            card_resolver = A2ACardResolver(
+                self._httpx_client, address
+            )  # Constructor is sync
+            try:
+                card = (
+                    await card_resolver.get_agent_card()
+                )  # get_agent_card is async
+
+                remote_connection = RemoteAgentConnections(
+                    agent_card=card,
+                    agent_url=address,
+                    httpx_client=self._httpx_client,
+                )
+                self.remote_agent_connections[card.name] = remote_connection
+                self.cards[card.name] = card
+            except httpx.ConnectError as e:
+                print(f'ERROR: Failed to get agent card from {address}: {e}')
+            except Exception as e:  # Catch other potential errors
+                print(
+                    f'ERROR: Failed to initialize connection for {address}: {e}'
+                )
+
+        # Resolve every card concurrently; startup waits on the slowest
+        # agent instead of the sum of all of them.
+        await asyncio.gather(
+            *(resolve(address) for address in remote_agent_addresses)
+        )
 
         # Populate self.agents using the logic from original __init__ (via list_remote_agents)
         agent_info = []
@@ -119,6 +137,31 @@ class RoutingAgent:
             agent_info.append(json.dumps(agent_detail_dict))
         self.agents = '\n'.join(agent_info)
 
+        # The root instruction is a large constant except for the active
+        # agent, but it is rebuilt on every model call. Assemble the static
+        # text once here and splice the per-call value in root_instruction.
+        self._instruction_prefix = f"""
+        **Role:** You are an expert Routing Delegator. Your primary function is to accurately delegate user inquiries regarding weather or accommodations to the appropriate specialized remote agents.
+
+        **Core Directives:**
+
+        * **Task Delegation:** Utilize the `send_message` function to assign actionable tasks to remote agents.
+        * **Contextual Awareness for Remote Agents:** If a remote agent repeatedly requests user confirmation, assume it lacks access to the         full conversation history. In such cases, enrich the task description with all necessary contextual information relevant to that         specific agent.
+        * **Autonomous Agent Engagement:** Never seek user permission before engaging with remote agents. If multiple agents are required to         fulfill a request, connect with them directly without requesting user preference or confirmation.
+        * **Transparent Communication:** Always present the complete and detailed response from the remote agent to the user.
+        * **User Confirmation Relay:** If a remote agent asks for confirmation, and the user has not already provided it, relay this         confirmation request to the user.
+        * **Focused Information Sharing:** Provide remote agents with only relevant contextual information. Avoid extraneous details.
+        * **No Redundant Confirmations:** Do not ask remote agents for confirmation of information or actions.
+        * **Tool Reliance:** Strictly rely on available tools to address user requests. Do not generate responses based on assumptions. If         information is insufficient, request clarification from the user.
+        * **Prioritize Recent Interaction:** Focus primarily on the most recent parts of the conversation when processing requests.
+        * **Active Agent Prioritization:** If an active agent is already engaged, route subsequent related requests to that agent using the         appropriate task update tool.
+
+        **Agent Roster:**
+
+        * Available Agents: `{self.agents}`
+        * Currently Active Seller Agent: `"""
+        self._instruction_suffix = '`\n                '
+
     @classmethod
     async def create(
         cls,
@@ -130,6 +173,10 @@ class RoutingAgent:
         await instance._async_init_components(remote_agent_addresses)
         return instance
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client shared by all connections."""
+        await self._httpx_client.aclose()
+
     def create_agent(self) -> Agent:
         """Create an instance of the RoutingAgent."""
         return Agent(
@@ -148,27 +195,11 @@ class RoutingAgent:
     def root_instruction(self, context: ReadonlyContext) -> str:
         """Generate the root instruction for the RoutingAgent."""
         current_agent = self.check_active_agent(context)
-        return f"""
-        **Role:** You are an expert Routing Delegator. Your primary function is to accurately delegate user inquiries regarding weather or accommodations to the appropriate specialized remote agents.
-
-        **Core Directives:**
-
-        * **Task Delegation:** Utilize the `send_message` function to assign actionable tasks to remote agents.
-        * **Contextual Awareness for Remote Agents:** If a remote agent repeatedly requests user confirmation, assume it lacks access to the         full conversation history. In such cases, enrich the task description with all necessary contextual information relevant to that         specific agent.
-        * **Autonomous Agent Engagement:** Never seek user permission before engaging with remote agents. If multiple agents are required to         fulfill a request, connect with them directly without requesting user preference or confirmation.
-        * **Transparent Communication:** Always present the complete and detailed response from the remote agent to the user.
-        * **User Confirmation Relay:** If a remote agent asks for confirmation, and the user has not already provided it, relay this         confirmation request to the user.
-        * **Focused Information Sharing:** Provide remote agents with only relevant contextual information. Avoid extraneous details.
-        * **No Redundant Confirmations:** Do not ask remote agents for confirmation of information or actions.
-        * **Tool Reliance:** Strictly rely on available tools to address user requests. Do not generate responses based on assumptions. If         information is insufficient, request clarification from the user.
-        * **Prioritize Recent Interaction:** Focus primarily on the most recent parts of the conversation when processing requests.
-        * **Active Agent Prioritization:** If an active agent is already engaged, route subsequent related requests to that agent using the         appropriate task update tool.
-
-        **Agent Roster:**
-
-        * Available Agents: `{self.agents}`
-        * Currently Active Seller Agent: `{current_agent['active_agent']}`
-                """
+        return (
+            self._instruction_prefix
+            + current_agent['active_agent']
+            + self._instruction_suffix
+        )
 
     def check_active_agent(self, context: ReadonlyContext):
         state = context.state
@@ -1,3 +1,5 @@
+import asyncio
+
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.types import (
@@ -32,7 +34,12 @@ class ChartGenerationAgentExecutor(AgentExecutor):
 
         query = context.get_user_input()
         try:
-            result = self.agent.invoke(query, context.context_id)
+            # invoke() is synchronous (CrewAI kickoff plus pandas/matplotlib
+            # chart rendering); run it in a worker thread so it doesn't pin
+            # the event loop while other requests are in flight.
+            result = await asyncio.to_thread(
+                self.agent.invoke, query, context.context_id
+            )
         except Exception as e:
             raise ServerError(
                 error=ValueError(f'Error invoking agent: {e}')
@@ -28,6 +28,18 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# genai.Client re-reads credentials and builds a transport on every
+# construction; share one across tool calls instead of paying that per
+# image request.
+_genai_client: genai.Client | None = None
+
+
+def _get_genai_client() -> genai.Client:
+    global _genai_client
+    if _genai_client is None:
+        _genai_client = genai.Client()
+    return _genai_client
+
 
 class Imagedata(BaseModel):
     """Represents image data.
@@ -55,7 +67,7 @@ def generate_image_tool(
     if not prompt:
         raise ValueError('Prompt cannot be empty')
 
-    client = genai.Client()
+    client = _get_genai_client()
     cache = InMemoryCache()
 
     text_input = (
@@ -232,8 +232,10 @@ class GitHubToolset:
         try:
             github = self._get_github_client()
 
-            # Add recent activity filter to query
-            search_query = f'{query} pushed:>={datetime.now() - timedelta(days=30):%Y-%m-%d}'
+            # Add recent activity filter to query. date().isoformat() gives
+            # the same YYYY-MM-DD without parsing a strftime pattern per call.
+            cutoff = (datetime.now() - timedelta(days=30)).date().isoformat()
+            search_query = f'{query} pushed:>={cutoff}'
 
             repos = []
             results = github.search_repositories(
@@ -1,6 +1,7 @@
-import json
 import logging
 
+import orjson
+
 from typing import Any
 
 from a2a.server.agent_execution import AgentExecutor
@@ -43,6 +44,17 @@ class OpenAIAgentExecutor(AgentExecutor):
         )
         self.model = 'anthropic/claude-3.5-sonnet'
         self.system_prompt = system_prompt
+        # The tool set is fixed for the lifetime of the executor, so build
+        # the OpenAI function schemas once here instead of re-inspecting
+        # signatures and docstrings on every request.
+        self._openai_tools = []
+        for tool_name, tool_instance in self.tools.items():
+            if hasattr(tool_instance, tool_name):
+                func = getattr(tool_instance, tool_name)
+                schema = self._extract_function_schema(func)
+                self._openai_tools.append(
+                    {'type': 'function', 'function': schema}
+                )
 
     async def _process_request(
         self,
@@ -55,14 +67,8 @@ class OpenAIAgentExecutor(AgentExecutor):
             {'role': 'user', 'content': message_text},
         ]
 
-        # Convert tools to OpenAI format
-        openai_tools = []
-        for tool_name, tool_instance in self.tools.items():
-            if hasattr(tool_instance, tool_name):
-                func = getattr(tool_instance, tool_name)
-                # Extract function schema from the method
-                schema = self._extract_function_schema(func)
-                openai_tools.append({'type': 'function', 'function': schema})
+        # Tools are already in OpenAI format; schemas were built in __init__.
+        openai_tools = self._openai_tools
 
         max_iterations = 10
         iteration = 0
@@ -97,7 +103,9 @@ class OpenAIAgentExecutor(AgentExecutor):
                     # Execute tool calls
                     for tool_call in message.tool_calls:
                         function_name = tool_call.function.name
-                        function_args = json.loads(tool_call.function.arguments)
+                        function_args = orjson.loads(
+                            tool_call.function.arguments
+                        )
 
                         logger.debug(
                             f'Calling function: {function_name} with args: {function_args}'
@@ -122,10 +130,12 @@ class OpenAIAgentExecutor(AgentExecutor):
                         # Serialize result properly - handle Pydantic models
                         if hasattr(result, 'model_dump'):
                             # It's a Pydantic model, use model_dump() to convert to dict
-                            result_json = json.dumps(result.model_dump())
+                            result_json = orjson.dumps(
+                                result.model_dump()
+                            ).decode()
                         elif isinstance(result, dict):
                             # It's a regular dict
-                            result_json = json.dumps(result)
+                            result_json = orjson.dumps(result).decode()
                         else:
                             # Convert to string as fallback
                             result_json = str(result)
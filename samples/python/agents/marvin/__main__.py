@@ -3,6 +3,7 @@ This is a sample agent that uses the Marvin framework to extract structured cont
 It is integrated with the Agent2Agent (A2A) protocol.
 """
 
+import ast
 import logging
 
 import click
@@ -34,6 +35,43 @@ class ContactInfo(BaseModel):
     role: str | None = Field(None, description="Job title or role if mentioned")
 
 
+# Types the --result-type option may name; anything else is rejected
+# instead of being eval()'d.
+_ALLOWED_RESULT_TYPES = {
+    "ContactInfo": ContactInfo,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+}
+
+
+def parse_result_type(expression: str):
+    """Resolve a --result-type expression without eval().
+
+    Accepts the names in _ALLOWED_RESULT_TYPES and subscripted generics
+    of them, e.g. ``list[ContactInfo]`` or ``dict[str, str]``.
+    """
+
+    def resolve(node: ast.expr):
+        if isinstance(node, ast.Name):
+            if node.id in _ALLOWED_RESULT_TYPES:
+                return _ALLOWED_RESULT_TYPES[node.id]
+            raise ValueError(f"Unknown result type: {node.id}")
+        if isinstance(node, ast.Subscript):
+            container = resolve(node.value)
+            if isinstance(node.slice, ast.Tuple):
+                return container[
+                    tuple(resolve(element) for element in node.slice.elts)
+                ]
+            return container[resolve(node.slice)]
+        raise ValueError(f"Unsupported result type expression: {expression!r}")
+
+    return resolve(ast.parse(expression, mode="eval").body)
+
+
 @click.command()
 @click.option("--host", "host", default="localhost")
 @click.option("--port", "port", default=10030)
@@ -46,7 +84,7 @@ class ContactInfo(BaseModel):
 def main(host, port, result_type, instructions):
     """Starts the Marvin Contact Extractor Agent server."""
     try:
-        result_type = eval(result_type)
+        result_type = parse_result_type(result_type)
     except Exception as e:
         logger.error(f"Invalid result type: {e}")
         exit(1)
@@ -53,7 +53,9 @@ def hello_world(text: str) -> str:
 
 def palindrome(text: str) -> str:
     """Report whether the input reads the same forwards and backwards."""
-    cleaned = ''.join(ch.lower() for ch in text if ch.isalnum())
+    # filter() and str.lower() run at C speed over the whole string; the
+    # per-character generator they replace was the slow part of this check.
+    cleaned = ''.join(filter(str.isalnum, text)).lower()
     if not cleaned:
         return 'Send me some text and I will check if it is a palindrome.'
     verdict = 'is' if cleaned == cleaned[::-1] else 'is not'
@@ -64,7 +66,9 @@ def reverse_words(text: str) -> str:
     """Reverse the order of the words in the input."""
     if not text.strip():
         return 'Send me a sentence and I will reverse the word order.'
-    return f'Reversed: {" ".join(reversed(text.split()))}'
+    # A list slice reverses in one C-level pass; reversed() adds an
+    # iterator hop per word on top of the same join.
+    return f'Reversed: {" ".join(text.split()[::-1])}'
 
 
 # --- One small AgentExecutor, parameterized by a transform function. ---
@@ -53,6 +53,7 @@ class HostAgent:
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
         self.agents: str = ''
+        self._agent_roster: list[dict[str, str]] = []
         loop = asyncio.get_running_loop()
         # Held to keep a strong reference for the lifetime of the host agent.
         self._init_task = loop.create_task(self.init_remote_agent_addresses(remote_agent_addresses))
@@ -77,8 +78,12 @@ class HostAgent:
         remote_connection = RemoteAgentConnections(self.client_factory, card)
         self.remote_agent_connections[card.name] = remote_connection
         self.cards[card.name] = card
-        agent_info = [json.dumps(ra) for ra in self.list_remote_agents()]
-        self.agents = '\n'.join(agent_info)
+        # The roster only changes here, so project it once per registration
+        # instead of on every list_remote_agents tool call.
+        self._agent_roster = [
+            {'name': card.name, 'description': card.description} for card in self.cards.values()
+        ]
+        self.agents = '\n'.join(json.dumps(ra) for ra in self._agent_roster)
 
     def create_agent(self) -> Agent:
         """Build the underlying ADK agent for the host."""
@@ -146,12 +151,7 @@ Current agent: {current_agent['active_agent']}
 
     def list_remote_agents(self) -> list[dict[str, str]]:
         """List the available remote agents you can use to delegate the task."""
-        if not self.remote_agent_connections:
-            return []
-
-        return [
-            {'name': card.name, 'description': card.description} for card in self.cards.values()
-        ]
+        return list(self._agent_roster)
 
     async def send_message(self, agent_name: str, message: str, tool_context: ToolContext) -> list:
         """Sends a task either streaming (if supported) or non-streaming.
@@ -223,7 +223,14 @@ Current agent: {current_agent['active_agent']}
 
 async def convert_parts(parts: list[Part], tool_context: ToolContext) -> list:
     """Convert a list of A2A Parts into ADK-friendly representations."""
-    return [await convert_part(p, tool_context) for p in parts]
+    # File parts await an artifact save each; run the conversions
+    # concurrently instead of one after another. gather preserves the
+    # input order of the parts.
+    return list(
+        await asyncio.gather(
+            *(convert_part(p, tool_context) for p in parts)
+        )
+    )
 
 
 async def convert_part(part: Part, tool_context: ToolContext) -> object: